@@ -1,14 +1,16 @@
 import os
+import re
 import pandas as pd
 import math
+from types import MappingProxyType
 
 # Directory and location setup
 current_dir = os.path.dirname(os.path.abspath(__file__))
 update_folder_dir = os.path.join(current_dir, 'updates')
 os.makedirs(update_folder_dir, exist_ok=True)
 
-# Location dictionary
-location_dict = {
+# Location dictionary (read-only, keyed by uppercase location code)
+location_dict = MappingProxyType({
     'A': 'Talea Mall Rest (Chevron)',
     'B': '1004 (VI)',
     'C': 'Ayangbure (Main)',
@@ -21,7 +23,13 @@ location_dict = {
     'M': 'Bask Lounge (Chevron)',
     'N': 'Shawarma Stand (Chevron)',
     'O': 'Pastry Pay Point (Chevron)'
-}
+})
+
+# Source columns used to build the output; everything else is never parsed
+SOURCE_COLUMNS = ['Name', 'Description', 'Qty', 'ValueIncVAT']
+
+# Item names matching this are delivery/packaging lines and carry no VAT
+NO_VAT_PATTERN = re.compile(r'delivery|pack', re.IGNORECASE)
 
 # Fetch all CSV files
 csv_files = [file for file in os.listdir(current_dir) if file.endswith('.csv')]
@@ -33,35 +41,42 @@ for csv_file in csv_files:
     file_name_without_ext = os.path.splitext(csv_file)[0]
     parts = file_name_without_ext.split('-')
     date_input = '-'.join(parts[1:])
-    location_code = parts[0]
-    
-    file_path = os.path.join(current_dir, csv_file)
-    df = pd.read_csv(file_path)
+    location_code = parts[0].upper()
 
-    if location_code.upper() not in location_dict:
-        print(f"Invalid location code '{location_code}'. Skipping file '{csv_file}'.")
+    # Validate the location before parsing so skipped files are never read
+    location_name = location_dict.get(location_code)
+    if location_name is None:
+        print(f"Invalid location code '{parts[0]}'. Skipping file '{csv_file}'.")
         continue
 
-    df['*InvoiceNo'] = location_code.upper() + date_input
-    df['*Customer'] = 'Walk In Customer'
-    df['*InvoiceDate'] = date_input
-    df['*DueDate'] = date_input
-    df['Terms'] = 'Due on receipt'
-    df['Location'] = location_dict[location_code]
-    df['Memo'] = ''
-    df['Item(Product/Service)'] = df['Name']
-    df['ItemDescription'] = df['Description']
-    df['ItemQuantity'] = df['Qty']
-    df['ItemRate'] = ''
-    df['*ItemAmount'] = df['ValueIncVAT']
-    df['*ItemTaxCode'] = df['Name'].apply(
-        lambda x: 'No VAT' if 'delivery' in x.lower() or 'pack' in x.lower() else 'Sales Tax'
-    )
-    df['*ItemTaxAmount'] = ''
-    df['Service Date'] = date_input
-
-    df = df.drop(df.index[-1])  # Remove the last row if needed
-    df_first_14_columns = df.iloc[:, :15]
+    file_path = os.path.join(current_dir, csv_file)
+    df = pd.read_csv(file_path, usecols=SOURCE_COLUMNS)
+
+    invoice_no = location_code + date_input
+    # Tax code is classified with one vectorized regex match instead of a
+    # per-row Python lambda
+    no_vat_mask = df['Name'].str.contains(NO_VAT_PATTERN, na=False)
+
+    # Build every output column up front and attach them in a single assign
+    df = df.assign(**{
+        '*InvoiceNo': invoice_no,
+        '*Customer': 'Walk In Customer',
+        '*InvoiceDate': date_input,
+        '*DueDate': date_input,
+        'Terms': 'Due on receipt',
+        'Location': location_name,
+        'Memo': '',
+        'Item(Product/Service)': df['Name'],
+        'ItemDescription': df['Description'],
+        'ItemQuantity': df['Qty'],
+        'ItemRate': '',
+        '*ItemAmount': df['ValueIncVAT'],
+        '*ItemTaxCode': no_vat_mask.map({True: 'No VAT', False: 'Sales Tax'}),
+        '*ItemTaxAmount': '',
+        'Service Date': date_input,
+    })
+
+    df = df.iloc[:-1]  # Remove the last row (totals footer)
     start_col = '*InvoiceNo'
     end_col = 'Service Date'
     final_columns = df.loc[:, start_col:end_col]
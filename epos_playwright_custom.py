@@ -1,90 +1,13 @@
-import re
 from playwright.sync_api import Playwright, sync_playwright
 import os
-from datetime import datetime
 import argparse
 
 # Load .env file if it exists (makes credential management easier)
 from load_env import load_env_file
 load_env_file()
 
-
-def navigate_to_month(page, target_date: str) -> None:
-    """Navigate calendar to the correct month if needed."""
-    target_dt = datetime.strptime(target_date, "%Y-%m-%d")
-    target_month_year = target_dt.strftime("%B %Y")
-    target_dt_month = datetime.strptime(target_month_year, "%B %Y")
-    
-    page.wait_for_timeout(500)
-    calendar_title = page.locator('.ajax__calendar_title:visible, td.title:visible, th.title:visible').first
-    
-    if calendar_title.count() == 0:
-        return
-    
-    try:
-        current_text = calendar_title.inner_text().strip().replace(",", "").strip()
-        if target_month_year in current_text:
-            return
-        
-        current_dt = datetime.strptime(current_text, "%B %Y")
-        prev_btn = page.locator('.ajax__calendar_prev:visible, a.ajax__calendar_prev:visible, a[title*="Previous" i]:visible, a[title*="Prev" i]:visible').first
-        next_btn = page.locator('.ajax__calendar_next:visible, a.ajax__calendar_next:visible, a[title*="Next" i]:visible').first
-        
-        for _ in range(24):  # Max 2 years
-            current_text = calendar_title.inner_text().strip().replace(",", "").strip()
-            if target_month_year in current_text:
-                break
-            
-            try:
-                current_dt = datetime.strptime(current_text, "%B %Y")
-            except ValueError:
-                break
-            
-            btn = prev_btn if current_dt > target_dt_month else next_btn
-            if btn.count() > 0:
-                btn.click()
-                page.wait_for_timeout(400)
-                prev_btn = page.locator('.ajax__calendar_prev:visible, a.ajax__calendar_prev:visible, a[title*="Previous" i]:visible, a[title*="Prev" i]:visible').first
-                next_btn = page.locator('.ajax__calendar_next:visible, a.ajax__calendar_next:visible, a[title*="Next" i]:visible').first
-            else:
-                break
-    except Exception:
-        pass
-
-
-def click_date_simple(page, target_date: str) -> None:
-    """Click a date in the calendar - navigate to correct month first, then find by title."""
-    target_dt = datetime.strptime(target_date, "%Y-%m-%d")
-    day_number = str(target_dt.day)
-    target_titles = [
-        target_dt.strftime("%d %B %Y"),      # "10 November 2025"
-        target_dt.strftime("%d %B, %Y"),     # "10 November, 2025"
-    ]
-    
-    navigate_to_month(page, target_date)
-    page.wait_for_timeout(500)
-    
-    # Try to find by title attribute (most reliable)
-    for title in target_titles:
-        day = page.locator(f'[id*="day"][title="{title}"]:visible').first
-        if day.count() > 0:
-            day.click()
-            page.wait_for_timeout(200)
-            return
-    
-    # Fallback: find by day number and verify title matches
-    for day_elem in page.locator(f'[id*="day"]:visible').all():
-        try:
-            if day_elem.inner_text().strip() == day_number:
-                day_title = day_elem.get_attribute("title") or ""
-                if any(title in day_title for title in target_titles):
-                    day_elem.click()
-                    page.wait_for_timeout(200)
-                    return
-        except:
-            continue
-    
-    raise RuntimeError(f"Could not find calendar day for date {target_date}")
+# Calendar helpers are shared with the single-date downloader
+from epos_playwright import click_date_simple
 
 
 def run(playwright: Playwright, from_date: str, to_date: str) -> None:
@@ -84,17 +84,12 @@ def load_uploaded_docnumbers(repo_root: str) -> set:
         return set()
 
 
-def save_uploaded_docnumber(repo_root: str, docnumber: str) -> None:
-    """Add a DocNumber to the uploaded ledger."""
+def save_uploaded_docnumbers(repo_root: str, docnumbers: set) -> None:
+    """Write the full set of uploaded DocNumbers to the ledger in one pass."""
     ledger_path = os.path.join(repo_root, "uploaded_docnumbers.json")
     
-    # Load existing
-    docnumbers = load_uploaded_docnumbers(repo_root)
-    docnumbers.add(docnumber)
-    
-    # Save back
     data = {
-        "docnumbers": sorted(list(docnumbers)),
+        "docnumbers": sorted(docnumbers),
         "last_updated": datetime.now().isoformat(),
     }
     
@@ -596,8 +591,10 @@ def main():
             print(f"\nSending SalesReceiptNo: {group_key}")
             send_sales_receipt(payload, token_mgr)
             
-            # Success - add to local ledger
-            save_uploaded_docnumber(repo_root, group_key)
+            # Success - persist to the local ledger immediately, reusing the
+            # in-memory set instead of re-reading the file per receipt
+            uploaded_docnumbers.add(group_key)
+            save_uploaded_docnumbers(repo_root, uploaded_docnumbers)
             stats["uploaded"] += 1
         except Exception as e:
             print(f"\n[ERROR] Failed to upload SalesReceiptNo {group_key}: {e}")